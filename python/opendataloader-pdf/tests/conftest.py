@@ -1,4 +1,3 @@
-import shutil
 from pathlib import Path
 
 import pytest
@@ -10,14 +9,5 @@ def input_pdf():
 
 
 @pytest.fixture
-def output_dir():
-    path = (
-        Path(__file__).resolve().parents[3]
-        / "python"
-        / "opendataloader-pdf"
-        / "tests"
-        / "temp"
-    )
-    path.mkdir(exist_ok=True)
-    yield path
-    shutil.rmtree(path, ignore_errors=True)
+def output_dir(tmp_path_factory, request):
+    return tmp_path_factory.mktemp(request.node.name)